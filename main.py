@@ -3,13 +3,17 @@ import os
 import asyncio
 import argparse
 
+# src/ is the import root: the package is always imported as `data_jobs`, never `src.data_jobs`,
+# so each module (and its state such as session_log) is loaded exactly once
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.data_jobs.data_ingestion import main_runner
-from src.data_jobs.db_manager import main as db_main
+# pipeline modules are imported inside the steps that use them, so a single-step run
+# skips the other step's heavy imports (twikit / google-cloud) and client setup
 
 async def run_full_pipeline():
     """runs the complete data ingestion and db sync pipeline"""
+    from data_jobs.data_ingestion import main_runner
+    from data_jobs.db_manager import main as db_main
     await main_runner()
     print("data ingested successfully")
     db_main()
@@ -42,10 +46,12 @@ def main():
 
     if args.ingest_only:
         print("--- running ingestion step only ---")
+        from data_jobs.data_ingestion import main_runner
         asyncio.run(main_runner())
         print("--- ingestion step is done ---")
     elif args.db_sync_only:
         print("--- running db sync step only ---")
+        from data_jobs.db_manager import main as db_main
         db_main()
         print("--- db sync step is done ---")
     else:
@@ -9,9 +9,10 @@ PROCESSED_DIR = os.path.abspath(os.path.join(DATA_DIR, 'processed'))
 
 COOKIES_FILE = os.path.abspath(os.path.join(RAW_DATA_DIR, 'cookies.json'))
 CONFIG_FILE = os.path.abspath(os.path.join(RAW_DATA_DIR, 'user_config.json'))
-FOLLOWING_FILE = os.path.abspath(os.path.join(RAW_DATA_DIR, 'following.json'))
-TWEETS_FILE = os.path.abspath(os.path.join(RAW_DATA_DIR, 'tweets.json'))
-LOGGING_FILE = os.path.abspath(os.path.join(PROCESSED_DIR, 'logging.json'))
+FOLLOWING_FILE = os.path.abspath(os.path.join(RAW_DATA_DIR, 'following.jsonl'))
+TWEETS_DIR = os.path.abspath(os.path.join(RAW_DATA_DIR, 'tweets'))
+LOGGING_FILE = os.path.abspath(os.path.join(PROCESSED_DIR, 'logging.jsonl'))
+LEGACY_LOGGING_FILE = os.path.abspath(os.path.join(PROCESSED_DIR, 'logging.json'))
 
 ##GCS Variables
 GCP_PROJECT_ID = os.getenv('GCP_PROJECT_ID')
@@ -2,24 +2,34 @@ import os
 from twikit import Client
 from twikit import errors as twikit_errors
 import asyncio
+import collections
+import httpx
 from dotenv import load_dotenv
-import json
+import orjson
+import operator
 import random
+import tempfile
 import time
+from dataclasses import dataclass
 from datetime import datetime
-import pytz
-from data_jobs import COOKIES_FILE, CONFIG_FILE, FOLLOWING_FILE, TWEETS_FILE, LOGGING_FILE
+from zoneinfo import ZoneInfo
+from data_jobs import COOKIES_FILE, CONFIG_FILE, FOLLOWING_FILE, TWEETS_DIR, LOGGING_FILE, LEGACY_LOGGING_FILE
 
 load_dotenv()
 USERNAME = os.getenv('TWITTER_USERNAME', '')
 EMAIL = os.getenv('TWITTER_EMAIL', '')
 PASSWORD = os.getenv('TWITTER_PASSWORD', '')
 TOTP_SECRET = os.getenv('TWITTER_TOTP_SECRET', '')
-client = Client('en-US')
+# pages are fetched 2-30s apart, past httpx's default 5s keep-alive expiry, so idle connections are
+# kept longer to reuse one TLS session across a whole run (kwargs are passed through to httpx.AsyncClient)
+_HTTP_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=90)
+client = Client('en-US', limits=_HTTP_LIMITS)
+_CST = ZoneInfo('America/Chicago')
 
 session_log = {
     'session_id': None,
     'start_time': None,
+    '_start_dt': None,
     'errors': [],
     'calls': 0,
     'new_following_count': 0,
@@ -27,38 +37,264 @@ session_log = {
     'attempts': 0
 }
 
+# session-constant part of every log entry, built once in main_runner
+_log_template = None
+
+# ids already persisted, built once per process from the JSONL files and extended as new rows are appended
+_SEEN_FOLLOWING_IDS = None
+_SEEN_TWEET_IDS = {}
+
+# last successful following run: scanned from the log on first use, then kept current by _collect_following
+_NOT_LOADED = object()
+_last_following_run = _NOT_LOADED
+
+# attributes every twikit Tweet carries, fetched in one call per tweet
+_TWEET_CORE_ATTRS = operator.attrgetter('id', 'text', 'user', 'created_at', 'retweet_count', 'favorite_count')
+
+# properties every twikit Media subclass defines (each returns None when the key is absent from the payload),
+# fetched in one call per media item; only AnimatedGif and Video also carry video_info.
+# twikit's Media.media_url already returns the https URL, so no media_url_https fallback is needed.
+_MEDIA_KEYS = ('type', 'url', 'media_url', 'display_url', 'expanded_url', 'sizes')
+_MEDIA_ATTRS = operator.attrgetter(*_MEDIA_KEYS)
+
+
+# endpoint: (max calls per window, window seconds, cooldown seconds when a 429 carries no reset time)
+_RATE_LIMITS = {
+    'following': (500, 900, 60),
+    'timeline': (500, 900, 300),
+}
+
+
+class _EndpointRateLimit:
+    """Per-endpoint call budget that delays calls before Twitter answers with a 429."""
+
+    def __init__(self, max_calls: int, window_seconds: int, cooldown_seconds: int) -> None:
+        self.max_calls = max_calls
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.reset_at = 0.0
+        self._calls = collections.deque()
+        self._lock = None
+
+    async def acquire(self) -> None:
+        """Wait until a call fits in the current window and no reset is pending, then record it."""
+        if self._lock is None:
+            # created lazily so it binds to the running loop (Python 3.9 binds at construction)
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.time()
+                if now < self.reset_at:
+                    await asyncio.sleep(self.reset_at - now)
+                    continue
+                while self._calls and now - self._calls[0] >= self.window_seconds:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(self.window_seconds - (now - self._calls[0]))
+
+    def block_until_reset(self, error) -> None:
+        """Hold further calls until the reset time reported by a TooManyRequests error.
+
+        Twitter refills the whole budget at the reset, so the local call history is dropped
+        rather than letting it delay calls that the new window already allows.
+        """
+        reset = getattr(error, 'rate_limit_reset', None) or time.time() + self.cooldown_seconds
+        self.reset_at = max(self.reset_at, reset)
+        self._calls.clear()
+
+
+_rate_buckets = {endpoint: _EndpointRateLimit(*limits) for endpoint, limits in _RATE_LIMITS.items()}
+
+
+async def _rate_limited_call(endpoint: str, call, *args, **kwargs):
+    """Await a twikit call once the endpoint's rate bucket allows it."""
+    bucket = _rate_buckets[endpoint]
+    await bucket.acquire()
+    try:
+        return await call(*args, **kwargs)
+    except twikit_errors.TooManyRequests as e:
+        bucket.block_until_reset(e)
+        raise
+
+
+async def _fetch_while(fetch, *overlapped):
+    """Run the page fetch coroutine concurrently with the overlapped awaitables and return the page.
+
+    If the overlapped work fails, the in-flight fetch is cancelled instead of being left orphaned.
+    """
+    next_page = asyncio.create_task(fetch)
+    try:
+        await asyncio.gather(*overlapped)
+    except BaseException:
+        next_page.cancel()
+        raise
+    return await next_page
+
+
+_BACKOFF_BASE_SECONDS = 2
+_BACKOFF_CAP_SECONDS = 300
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff delay for the given retry attempt, capped and jittered by +/-50%."""
+    return min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+@dataclass
+class Tweet:
+    """A collected timeline tweet; orjson serializes it natively as a JSON object in field order."""
+    __slots__ = (
+        'id', 'text', 'author', 'author_name', 'created_at', 'retweet_count', 'favorite_count', 'view_count',
+        'media', 'quote_tweet', 'entities', 'urls', 'hashtags', 'is_retweet', 'is_quote', 'lang',
+    )
+    id: str
+    text: str
+    author: str
+    author_name: str
+    created_at: str
+    retweet_count: int
+    favorite_count: int
+    view_count: object
+    media: list
+    quote_tweet: object
+    entities: object
+    urls: list
+    hashtags: list
+    is_retweet: bool
+    is_quote: bool
+    lang: str
+
+
+def _read_json(path: str):
+    """Load and return the JSON document stored at path."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flush a directory entry (new file or rename) to disk; a no-op where directories can't be opened, e.g. Windows."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
 
 def _atomic_write_json(path: str, data) -> None:
-    """Write JSON atomically by writing to a temp file then replacing."""
+    """Write JSON atomically by writing to a temp file, replacing, then syncing the directory.
+
+    The temp file is created exclusively (mkstemp uses O_CREAT|O_EXCL), so concurrent
+    writers never share or truncate each other's temp file; the last replace wins whole.
+    """
     directory = os.path.dirname(path)
     os.makedirs(directory, exist_ok=True)
-    tmp_path = f"{path}.tmp"
-    with open(tmp_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def _append_jsonl(path: str, entries) -> None:
+    """Append JSON records to a JSONL file, one record per line, in a single write, then flush and fsync."""
+    if not entries:
+        return
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    created = not os.path.exists(path)
+    with open(path, 'ab') as f:
+        f.write(b"".join(orjson.dumps(entry) + b"\n" for entry in entries))
         f.flush()
         os.fsync(f.fileno())
-    os.replace(tmp_path, path)
+    if created:
+        _fsync_directory(directory)
+
+
+async def _append_jsonl_async(path: str, entries) -> None:
+    """Append records in a worker thread; an empty batch returns without touching the file."""
+    if entries:
+        await asyncio.to_thread(_append_jsonl, path, entries)
+
+
+def _id_key(record_id):
+    """Key used in the seen-id sets: numeric ids as ints, which take about half the memory of their
+    strings and hash faster; anything non-numeric is kept as-is"""
+    try:
+        return int(record_id)
+    except (TypeError, ValueError):
+        return record_id
+
+
+def _read_jsonl_ids(path: str) -> set:
+    """Stream a JSONL file line by line and collect the 'id' of every record, keyed by _id_key."""
+    ids = set()
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    ids.add(_id_key(orjson.loads(line)['id']))
+                except (orjson.JSONDecodeError, KeyError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return ids
+
+
+def _iter_lines_reversed(path: str, block_size: int = 64 * 1024):
+    """Yield the lines of a file newest-first, reading backwards in fixed-size blocks."""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            # the first piece may be a partial line; carry it into the next block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line
+        yield remainder
+
+
+# twikit error -> (logged error type, printed message), for handle_errors
+_API_ERROR_MAP = {
+    twikit_errors.UserNotFound: ('user_not_found', "User not found"),
+    twikit_errors.UserUnavailable: ('user_unavailable', "User unavailable"),
+    twikit_errors.Forbidden: ('access_forbidden', "Access forbidden"),
+    twikit_errors.Unauthorized: ('unauthorized', "Not authorized"),
+    twikit_errors.AccountSuspended: ('account_suspended', "Account suspended"),
+    twikit_errors.TooManyRequests: ('rate_limited', "Rate limited"),
+    twikit_errors.ServerError: ('server_error', "Server error"),
+    twikit_errors.BadRequest: ('bad_request', "Bad request"),
+}
+_API_ERROR_TYPES = tuple(_API_ERROR_MAP)
 
 
 def handle_errors(default_return=None, function_name=None):
     """Decorator to handle common Twitter API errors"""
     def decorator(func):
         async def wrapper(*args, **kwargs):
-            error_map = {
-                twikit_errors.UserNotFound: ('user_not_found', "User not found"),
-                twikit_errors.UserUnavailable: ('user_unavailable', "User unavailable"),
-                twikit_errors.Forbidden: ('access_forbidden', "Access forbidden"),
-                twikit_errors.Unauthorized: ('unauthorized', "Not authorized"),
-                twikit_errors.AccountSuspended: ('account_suspended', "Account suspended"),
-                twikit_errors.TooManyRequests: ('rate_limited', "Rate limited"),
-                twikit_errors.ServerError: ('server_error', "Server error"),
-                twikit_errors.BadRequest: ('bad_request', "Bad request"),
-            }
-
             try:
                 return await func(*args, **kwargs)
-            except tuple(error_map.keys()) as e:
-                error_type, message = error_map[type(e)]
+            except _API_ERROR_TYPES as e:
+                error_type, message = _API_ERROR_MAP[type(e)]
                 print(f"Error: {message}")
                 await log_errors(error_type, str(e), function_name or func.__name__)
                 return default_return if default_return is not None else []
@@ -71,39 +307,49 @@ def handle_errors(default_return=None, function_name=None):
     return decorator
 
 
-@handle_errors(default_return=[])
-async def log_session_data(status, additional_data=None):
-    """Log session data to logging.json"""
-    cst = pytz.timezone('US/Central')
-    current_time = datetime.now(cst).isoformat()
-    log_entry = {
+def _build_log_template():
+    """Build the fields of a log entry that stay fixed for the session, in log key order"""
+    return {
         'session_id': session_log['session_id'],
-        'timestamp': current_time,
-        'status': status,
+        'timestamp': None,
+        'status': None,
         'start_time': session_log['start_time'],
-        'runtime_seconds': (datetime.now(cst) - datetime.fromisoformat(session_log['start_time'])).total_seconds() if session_log['start_time'] else 0,
+        'runtime_seconds': 0,
         'errors': session_log['errors'],
-        'calls': session_log['calls'],
-        'new_following_count': session_log['new_following_count'],
-        'tweets_collected': session_log['tweets_collected'],
-        'attempts': session_log['attempts']
+        'calls': 0,
+        'new_following_count': 0,
+        'tweets_collected': 0,
+        'attempts': 0
     }
 
+
+async def log_session_data(status, additional_data=None):
+    """Log session data to logging.jsonl"""
+    now = datetime.now(_CST)
+    log_entry = (_log_template or _build_log_template()).copy()
+    log_entry['timestamp'] = now.isoformat()
+    log_entry['status'] = status
+    if session_log['_start_dt']:
+        log_entry['runtime_seconds'] = (now - session_log['_start_dt']).total_seconds()
+    log_entry['calls'] = session_log['calls']
+    log_entry['new_following_count'] = session_log['new_following_count']
+    log_entry['tweets_collected'] = session_log['tweets_collected']
+    log_entry['attempts'] = session_log['attempts']
+
     if additional_data:
         log_entry.update(additional_data)
     try:
-        with open(LOGGING_FILE, 'r') as f:
-            logs = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        logs = []
-    logs.append(log_entry)
-    _atomic_write_json(LOGGING_FILE, logs)
+        await asyncio.to_thread(_append_jsonl, LOGGING_FILE, [log_entry])
+    except OSError as e:
+        # a failed log write should not abort the collection run
+        print(f"Error: could not write session log: {e}")
+        await log_errors('log_write_failed', str(e), 'log_session_data')
 
 
 async def log_errors(error_type, error_message, function_name):
     """Log an error to the session log"""
     error_entry = {
-        'timestamp': datetime.now(pytz.timezone('US/Central')).isoformat(),
+        'timestamp': datetime.now(_CST).isoformat(),
         'type': error_type,
         'message': str(error_message),
         'function': function_name
@@ -111,13 +357,35 @@ async def log_errors(error_type, error_message, function_name):
     session_log['errors'].append(error_entry)
 
 
-def get_last_following_run():
-    """Get the timestamp of the most recent successful following collection"""
+def _iter_log_entries_newest_first():
+    """Yield session log entries newest-first: logging.jsonl from its tail, then a legacy logging.json array if present"""
+    try:
+        for line in _iter_lines_reversed(LOGGING_FILE):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+    except FileNotFoundError:
+        pass
+
     try:
-        with open(LOGGING_FILE, 'r') as f:
-            logs = json.load(f)
+        legacy_logs = _read_json(LEGACY_LOGGING_FILE)
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return
+    if isinstance(legacy_logs, list):
+        yield from reversed(legacy_logs)
+
 
-        for log_entry in reversed(logs):
+def _scan_last_following_run():
+    """Find the timestamp of the most recent successful following collection in the session log"""
+    try:
+        # only the tail of the log is read and parsed until a match is found
+        for log_entry in _iter_log_entries_newest_first():
+            if not isinstance(log_entry, dict):
+                continue
             if (log_entry.get('status') == 'following_complete' and
                 log_entry.get('following_collected', 0) > 0):
                 timestamp_str = log_entry.get('timestamp')
@@ -128,14 +396,22 @@ def get_last_following_run():
                     except Exception:
                         return None
                     if ts.tzinfo is None:
-                        ts = pytz.timezone('US/Central').localize(ts)
+                        ts = ts.replace(tzinfo=_CST)
                     return ts
 
         return None
-    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+    except KeyError:
         return None
 
 
+def get_last_following_run():
+    """Get the timestamp of the most recent successful following collection, scanning the log once per process"""
+    global _last_following_run
+    if _last_following_run is _NOT_LOADED:
+        _last_following_run = _scan_last_following_run()
+    return _last_following_run
+
+
 def should_run_following():
     """Determine if following collection should run (2-3 times per week)
         - if no previous run found, run it
@@ -147,12 +423,11 @@ def should_run_following():
     if last_run is None:
         return True
 
-    cst = pytz.timezone('US/Central')
-    current_time = datetime.now(cst)
+    current_time = datetime.now(_CST)
     if last_run.tzinfo is None:
-        last_run = cst.localize(last_run)
+        last_run = last_run.replace(tzinfo=_CST)
     else:
-        last_run = last_run.astimezone(cst)
+        last_run = last_run.astimezone(_CST)
 
     hours_since = (current_time - last_run).total_seconds() / 3600
     if hours_since > 168:
@@ -167,23 +442,80 @@ def should_run_following():
 def extract_media_info(tweet):
     """Extract comprehensive media information from a tweet"""
     media_info = []
-    if hasattr(tweet, 'media') and tweet.media:
-        for media in tweet.media:
-            media_data = {
-                'type': getattr(media, 'type', 'unknown'),
-                'url': getattr(media, 'url', ''),
-                'media_url': getattr(media, 'media_url_https', getattr(media, 'media_url', '')),
-                'display_url': getattr(media, 'display_url', ''),
-                'expanded_url': getattr(media, 'expanded_url', ''),
-                'sizes': getattr(media, 'sizes', {}),
-                'video_info': getattr(media, 'video_info', None) if hasattr(media, 'video_info') else None
-            }
-            media_info.append(media_data)
+    for media in getattr(tweet, 'media', None) or ():
+        info = dict(zip(_MEDIA_KEYS, _MEDIA_ATTRS(media)))
+        info['video_info'] = getattr(media, 'video_info', None)
+        media_info.append(info)
     return media_info
 
 
+def _build_batch(timeline, existing_tweets):
+    """Build Tweet records for the page's tweets not yet in existing_tweets, adding their ids to it"""
+    batch_tweets = []
+    # batching tweets logic: expand to 200 tweets per page, then pull tweets
+    for tweet in timeline:
+        tweet_key = _id_key(tweet.id)
+        if tweet_key not in existing_tweets:
+            tweet_id, text, user, created_at, retweet_count, favorite_count = _TWEET_CORE_ATTRS(tweet)
+            quote = getattr(tweet, 'quote', None)
+            retweeted = getattr(tweet, 'retweeted_tweet', None)
+            quote_tweet = None
+            if quote is not None:
+                quote_user = getattr(quote, 'user', None)
+                quote_tweet = {
+                    'id': quote.id,
+                    'text': quote.text,
+                    'author': quote_user.screen_name if quote_user is not None else None,
+                    'media': extract_media_info(quote)
+                }
+            tweet_info = Tweet(
+                tweet_id,
+                text,
+                user.screen_name,
+                user.name,
+                created_at,
+                retweet_count,
+                favorite_count,
+                getattr(tweet, 'view_count', 0),
+                extract_media_info(tweet),
+                quote_tweet,
+                getattr(tweet, 'entities', {}),
+                getattr(tweet, 'urls', []),
+                getattr(tweet, 'hashtags', []),
+                retweeted is not None,
+                quote is not None,
+                getattr(tweet, 'lang', 'unknown'),
+            )
+            batch_tweets.append(tweet_info)
+            existing_tweets.add(tweet_key)
+    return batch_tweets
+
+
+# created on first use so it binds to the running event loop
+_auth_lock = None
+
+
 async def ensure_authenticated():
-    """Ensure client is authenticated, using cookies or fresh login"""
+    """Ensure client is authenticated; concurrent collectors share one login attempt at a time"""
+    global _auth_lock
+    if _auth_lock is None:
+        _auth_lock = asyncio.Lock()
+    async with _auth_lock:
+        await _authenticate()
+
+
+# twikit error -> (logged error type, printed message), for a failed login
+_LOGIN_ERROR_MAP = {
+    twikit_errors.AccountLocked: ('account_locked', "Account is locked - may need captcha solving"),
+    twikit_errors.AccountSuspended: ('account_suspended', "Account is suspended"),
+    twikit_errors.Unauthorized: ('unauthorized', "Invalid credentials"),
+    twikit_errors.TooManyRequests: ('rate_limited', "Rate limited - wait before retrying"),
+}
+_LOGIN_ERROR_TYPES = tuple(_LOGIN_ERROR_MAP)
+
+
+async def _authenticate():
+    """Authenticate the client, using cookies or fresh login"""
     session_log['attempts'] += 1
     try:
         client.load_cookies(COOKIES_FILE)
@@ -192,13 +524,6 @@ async def ensure_authenticated():
         print(f"Cookie loading failed: {e}; starting a new session")
         await log_errors('cookie_load_failed', str(e), 'ensure_authenticated')
 
-    error_map = {
-        twikit_errors.AccountLocked: ('account_locked', "Account is locked - may need captcha solving"),
-        twikit_errors.AccountSuspended: ('account_suspended', "Account is suspended"),
-        twikit_errors.Unauthorized: ('unauthorized', "Invalid credentials"),
-        twikit_errors.TooManyRequests: ('rate_limited', "Rate limited - wait before retrying"),
-    }
-
     try:
         await client.login(
             auth_info_1=USERNAME,
@@ -208,8 +533,8 @@ async def ensure_authenticated():
             totp_secret=TOTP_SECRET
         )
         print("Login successful")
-    except tuple(error_map.keys()) as e:
-        error_type, message = error_map[type(e)]
+    except _LOGIN_ERROR_TYPES as e:
+        error_type, message = _LOGIN_ERROR_MAP[type(e)]
         print(f"Error: {message}")
         await log_errors(error_type, str(e), 'ensure_authenticated')
         raise
@@ -222,194 +547,165 @@ async def ensure_authenticated():
 async def get_my_user_id():
     """Gets the current user's ID, caching it to avoid repeated API calls."""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-            if 'user_id' in config:
-                return config['user_id']
-    except (FileNotFoundError, json.JSONDecodeError):
+        config = await asyncio.to_thread(_read_json, CONFIG_FILE)
+        if 'user_id' in config:
+            return config['user_id']
+    except (FileNotFoundError, orjson.JSONDecodeError):
         pass
 
     print("no user ID in cache, gettin' from API")
     me = await client.get_user_by_screen_name(USERNAME)
     session_log['calls'] += 1
     if me:
-        _atomic_write_json(CONFIG_FILE, {'user_id': me.id})
+        await asyncio.to_thread(_atomic_write_json, CONFIG_FILE, {'user_id': me.id})
         return me.id
     return None
 
 
 @handle_errors(default_return=[])
 async def get_my_following():
+    """Append new followings to following.jsonl and return the ids of every known following"""
+    global _SEEN_FOLLOWING_IDS
     await ensure_authenticated()
     local_calls = 0
 
-    try:
-        with open(FOLLOWING_FILE, 'r') as f:
-            existing_data = json.load(f)
-            existing_ids = {user['id'] for user in existing_data}
-    except (FileNotFoundError, json.JSONDecodeError):
-        existing_data = []
-        existing_ids = set()
+    if _SEEN_FOLLOWING_IDS is None:
+        _SEEN_FOLLOWING_IDS = await asyncio.to_thread(_read_jsonl_ids, FOLLOWING_FILE)
+    existing_ids = _SEEN_FOLLOWING_IDS
 
     my_user_id = await get_my_user_id()
     if not my_user_id:
         print("no user ID found, aborting following check")
         return []
 
-    following = await client.get_user_following(user_id=my_user_id, count=200)
+    following = await _rate_limited_call('following', client.get_user_following, user_id=my_user_id, count=200)
     local_calls += 1
     session_log['calls'] += 1
 
-    new_following = []
+    new_following_count = 0
     pages_without_new_users = 0
     max_empty_pages = 2
+    retry_attempt = 0
 
     while True:
-        page_new_count = 0
-        for friend in following:
-            if friend.id not in existing_ids:
-                friend_info = {
-                    'username': friend.screen_name,
-                    'url': f'https://twitter.com/{friend.screen_name}',
-                    'name': friend.name,
-                    'description': getattr(friend, 'description', ''),
-                    'id': friend.id
-                }
-                new_following.append(friend_info)
-                existing_ids.add(friend.id)
-                page_new_count += 1
+        page_friends = {_id_key(friend.id): friend for friend in following}
+        new_ids = page_friends.keys() - existing_ids
+        # iterate the page dict rather than new_ids to keep Twitter's ordering
+        page_new_following = [
+            {
+                'username': friend.screen_name,
+                'url': f'https://twitter.com/{friend.screen_name}',
+                'name': friend.name,
+                'description': getattr(friend, 'description', ''),
+                'id': friend.id
+            }
+            for friend_key, friend in page_friends.items() if friend_key in new_ids
+        ]
+        existing_ids |= new_ids
+        page_new_count = len(page_new_following)
+        new_following_count += page_new_count
+        persist = _append_jsonl_async(FOLLOWING_FILE, page_new_following)
 
-        if not (hasattr(following, 'next_cursor') and following.next_cursor):
-            break
         if page_new_count == 0:
             pages_without_new_users += 1
-            if pages_without_new_users >= max_empty_pages:
-                break
         else:
             pages_without_new_users = 0
+        if not (hasattr(following, 'next_cursor') and following.next_cursor) or pages_without_new_users >= max_empty_pages:
+            await persist
+            break
 
-        await asyncio.sleep(random.uniform(2, 8))
+        delay = random.uniform(2, 8)
         if random.random() < 0.1:
-            await asyncio.sleep(random.uniform(15, 30))
+            delay += random.uniform(15, 30)
 
         try:
-            following = await following.next()
+            # request the next page right away; the file append and the jitter delay overlap with it
+            following = await _fetch_while(_rate_limited_call('following', following.next), persist, asyncio.sleep(delay))
             local_calls += 1
             session_log['calls'] += 1
+            retry_attempt = 0
         except twikit_errors.TooManyRequests as e:
-            print("rate limited, sleep for 60 seconds")
+            print("rate limited, waiting for the rate limit reset")
             await log_errors('rate_limited', str(e), 'get_my_following')
-            await asyncio.sleep(60)
             continue
         except twikit_errors.ServerError as e:
-            print("server error, sleep for 30 seconds")
+            delay = _backoff_delay(retry_attempt)
+            retry_attempt += 1
+            print(f"server error, sleep for {delay:.0f} seconds")
             await log_errors('server_error', str(e), 'get_my_following')
-            await asyncio.sleep(30)
+            await asyncio.sleep(delay)
             continue
 
-    all_data = existing_data + new_following
-    _atomic_write_json(FOLLOWING_FILE, all_data)
-
-    session_log['new_following_count'] = len(new_following)
-    print(f"added {len(new_following)} new followings. total following: {len(all_data)}")
+    session_log['new_following_count'] = new_following_count
+    print(f"added {new_following_count} new followings. total following: {len(existing_ids)}")
     print(f"total calls in get_my_following: {local_calls}")
-    return all_data
+    return existing_ids
 
 
 @handle_errors(default_return=[])
 async def get_my_feed():
     await ensure_authenticated()
     calls = 0
-    cst = pytz.timezone('US/Central')
-    current_date = datetime.now(cst).strftime('%Y-%m-%d')
+    current_date = datetime.now(_CST).strftime('%Y-%m-%d')
+    tweets_file = os.path.join(TWEETS_DIR, f"{current_date}.jsonl")
 
-    try:
-        with open(TWEETS_FILE, 'r') as f:
-            existing_data = json.load(f)
-            if current_date in existing_data:
-                existing_tweets = {tweet['id'] for tweet in existing_data[current_date]}
-            else:
-                existing_tweets = set()
-                existing_data[current_date] = []
-    except (FileNotFoundError, json.JSONDecodeError):
-        existing_data = {current_date: []}
-        existing_tweets = set()
+    existing_tweets = _SEEN_TWEET_IDS.get(current_date)
+    if existing_tweets is None:
+        existing_tweets = await asyncio.to_thread(_read_jsonl_ids, tweets_file)
+        # only today's shard is ever appended to, so earlier days' id sets can go
+        _SEEN_TWEET_IDS.clear()
+        _SEEN_TWEET_IDS[current_date] = existing_tweets
 
     all_tweets = []
     target_tweets = 200
     session_duration = 3600  #i.e. 1 hour
     start_time = time.time()
 
+    retry_attempt = 0
+
     print(f"tryna get {target_tweets} tweets over {session_duration/60} mins")
 
-    timeline = await client.get_timeline(count=200)
+    timeline = await _rate_limited_call('timeline', client.get_timeline, count=200)
     calls += 1
     session_log['calls'] += 1
 
     while len(all_tweets) < target_tweets and (time.time() - start_time) < session_duration:
         try:
-            batch_tweets = []
-            # batching tweets logic: expand to 200 tweets per page, then pull tweets
-            for tweet in timeline:
-                if tweet.id not in existing_tweets:
-                    main_media = extract_media_info(tweet)
-                    quote_media = []
-                    if hasattr(tweet, 'quote') and tweet.quote:
-                        quote_media = extract_media_info(tweet.quote)
-                    tweet_info = {
-                        'id': tweet.id,
-                        'text': tweet.text,
-                        'author': tweet.user.screen_name,
-                        'author_name': tweet.user.name,
-                        'created_at': tweet.created_at,
-                        'retweet_count': tweet.retweet_count,
-                        'favorite_count': tweet.favorite_count,
-                        'view_count': getattr(tweet, 'view_count', 0),
-                        'media': main_media,
-                        'quote_tweet': {
-                            'id': tweet.quote.id if hasattr(tweet, 'quote') and tweet.quote else None,
-                            'text': tweet.quote.text if hasattr(tweet, 'quote') and tweet.quote else None,
-                            'author': tweet.quote.user.screen_name if hasattr(tweet, 'quote') and tweet.quote and hasattr(tweet.quote, 'user') else None,
-                            'media': quote_media
-                        } if hasattr(tweet, 'quote') and tweet.quote else None,
-                        'entities': getattr(tweet, 'entities', {}),
-                        'urls': getattr(tweet, 'urls', []),
-                        'hashtags': getattr(tweet, 'hashtags', []),
-                        'is_retweet': hasattr(tweet, 'retweeted_tweet') and tweet.retweeted_tweet is not None,
-                        'is_quote': hasattr(tweet, 'quote') and tweet.quote is not None,
-                        'lang': getattr(tweet, 'lang', 'unknown'),
-                    }
-                    batch_tweets.append(tweet_info)
-                    existing_tweets.add(tweet.id)
+            # the per-tweet attribute work runs in a thread so the event loop keeps serving the
+            # concurrent following collection and in-flight requests meanwhile
+            batch_tweets = await asyncio.to_thread(_build_batch, timeline, existing_tweets)
 
             all_tweets.extend(batch_tweets)
             session_log['tweets_collected'] = len(all_tweets)
             print(f"pulled {len(batch_tweets)} new tweets. total tweets: {len(all_tweets)}/{target_tweets}")
-            existing_data[current_date].extend(batch_tweets)
-            _atomic_write_json(TWEETS_FILE, existing_data)
+            persist = _append_jsonl_async(tweets_file, batch_tweets)
 
             # check for next page
-            if not (hasattr(timeline, 'next_cursor') and timeline.next_cursor):
+            if not getattr(timeline, 'next_cursor', None):
+                await persist
                 print("no more tweets available")
                 break
 
-            # wait and get next page
+            # wait and get next page; the request is issued first so the file append and the wait overlap with it
             if len(all_tweets) < target_tweets and (time.time() - start_time) < session_duration:
                 wait_time = random.randint(5, 30)
                 print(f"waiting {wait_time}secs before next batch...")
-                await asyncio.sleep(wait_time)
-                timeline = await timeline.next()
+                timeline = await _fetch_while(_rate_limited_call('timeline', timeline.next), persist, asyncio.sleep(wait_time))
                 calls += 1
                 session_log['calls'] += 1
+                retry_attempt = 0
+            else:
+                await persist
 
         except twikit_errors.TooManyRequests as e:
-            print("rate limit error, sleep for 5 mins")
+            print("rate limit error, waiting for the rate limit reset")
             await log_errors('rate_limited', str(e), 'get_my_feed')
-            await asyncio.sleep(300)
         except twikit_errors.ServerError as e:
-            print("server error, sleep for 30 secs")
+            delay = _backoff_delay(retry_attempt)
+            retry_attempt += 1
+            print(f"server error, sleep for {delay:.0f} secs")
             await log_errors('server_error', str(e), 'get_my_feed')
-            await asyncio.sleep(30)
+            await asyncio.sleep(delay)
         except twikit_errors.BadRequest as e:
             print(f"bad request: {e}")
             await log_errors('bad_request', str(e), 'get_my_feed')
@@ -421,7 +717,8 @@ async def get_my_feed():
         except Exception as e:
             print(f"unexpected error: {e}")
             await log_errors('unexpected_error', str(e), 'get_my_feed')
-            await asyncio.sleep(10)
+            await asyncio.sleep(_backoff_delay(retry_attempt))
+            retry_attempt += 1
 
     elapsed_time = time.time() - start_time
     session_log['tweets_collected'] = len(all_tweets)
@@ -431,20 +728,42 @@ async def get_my_feed():
     return all_tweets
 
 
+async def _collect_following():
+    """Run the following collection and log its completion"""
+    global _last_following_run
+    following_result = await get_my_following()
+    following_collected = len(following_result) if following_result else 0
+    await log_session_data('following_complete', {
+        'following_collected': following_collected
+    })
+    if following_collected > 0:
+        _last_following_run = datetime.now(_CST)
+    return following_result
+
+
+async def _collect_feed():
+    """Run the feed collection and log its completion"""
+    tweets_result = await get_my_feed()
+    await log_session_data('tweets_complete', {
+        'tweets_collected': len(tweets_result) if tweets_result else 0
+    })
+    return tweets_result
+
+
 @handle_errors(default_return=None)
 async def main_runner():
-    cst = pytz.timezone('US/Central')
+    global _log_template
     session_log['session_id'] = f"session_{int(time.time())}"
-    session_log['start_time'] = datetime.now(cst).isoformat()
+    session_log['_start_dt'] = datetime.now(_CST)
+    session_log['start_time'] = session_log['_start_dt'].isoformat()
+    _log_template = _build_log_template()
     print(f"starting session: {session_log['session_id']}")
     await log_session_data('started')
 
     if should_run_following():
-        print("running following collection...")
-        following_result = await get_my_following()
-        await log_session_data('following_complete', {
-            'following_collected': len(following_result) if following_result else 0
-        })
+        # following and timeline use separate rate buckets, so both collections run at once
+        print("running following collection alongside the feed...")
+        following_result, tweets_result = await asyncio.gather(_collect_following(), _collect_feed())
     else:
         print("skipping following collection (ran recently)")
         following_result = []
@@ -453,18 +772,14 @@ async def main_runner():
             'reason': 'recent_run',
             'following_collected': 0
         })
-
-    tweets_result = await get_my_feed()
-    await log_session_data('tweets_complete', {
-        'tweets_collected': len(tweets_result) if tweets_result else 0
-    })
+        tweets_result = await _collect_feed()
 
     await log_session_data('completed', {
         'final_following_count': len(following_result) if following_result else 0,
         'final_tweets_count': len(tweets_result) if tweets_result else 0,
         'success': True
     })
-    print(f"session {session_log['session_id']} successful, added to logging.json")
+    print(f"session {session_log['session_id']} successful, added to logging.jsonl")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
 import os
+import re
 import sqlite3
-import json
+import orjson
 import tempfile
+import itertools
+import functools
+import operator
+import concurrent.futures
 from google.cloud import storage, bigquery
 from google.api_core.exceptions import NotFound
 from data_jobs import GCP_PROJECT_ID, GCS_BUCKET_NAME, BIGQUERY_DATASET_ID
@@ -10,6 +15,15 @@ storage_client = storage.Client(project=GCP_PROJECT_ID)
 bq_client = bigquery.Client(project=GCP_PROJECT_ID)
 
 
+# BigQuery column-name rules; anything that passes is also a plain SQLite identifier
+IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]{0,299}')
+
+
+def is_valid_identifier(identifier) -> bool:
+    """check a table/column name against IDENTIFIER_RE."""
+    return isinstance(identifier, str) and IDENTIFIER_RE.fullmatch(identifier) is not None
+
+
 def quote_identifier(identifier: str) -> str:
     """Safely quote SQLite identifiers (table/column names)."""
     if not isinstance(identifier, str):
@@ -18,6 +32,10 @@ def quote_identifier(identifier: str) -> str:
     return '"' + identifier.replace('"', '""') + '"'
 
 
+# concurrent shard downloads in download_prefix_from_gcs
+GCS_DOWNLOAD_WORKERS = 8
+
+
 def download_from_gcs(source_blob_name, destination_file_name):
     """downloads a file from GCS to a local path."""
     try:
@@ -34,53 +52,113 @@ def download_from_gcs(source_blob_name, destination_file_name):
         return False
 
 
-def load_db_to_bigquery(db_path, table_name, dataset_id):
-    """loads data from a SQLite database table into a BigQuery table."""
-    print(f"starting BQ load for '{table_name}' from '{db_path}'")
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM {quote_identifier(table_name)}")
-    rows = cursor.fetchall()
-    if not rows:
-        print(f"no data found in SQLite table '{table_name}'. skipping BQ load")
-        return
+def download_prefix_from_gcs(source_prefix, destination_dir):
+    """downloads every file under a GCS prefix into a local directory, returning the local paths."""
+    try:
+        os.makedirs(destination_dir, exist_ok=True)
+        blobs = [blob for blob in storage_client.list_blobs(GCS_BUCKET_NAME, prefix=source_prefix) if not blob.name.endswith('/')]
+        local_paths = [os.path.join(destination_dir, os.path.basename(blob.name)) for blob in blobs]
+        # each shard is a separate GET, so they're fetched concurrently; list() re-raises the first failure
+        with concurrent.futures.ThreadPoolExecutor(max_workers=GCS_DOWNLOAD_WORKERS) as executor:
+            list(executor.map(lambda blob, path: blob.download_to_filename(path), blobs, local_paths))
+        if not local_paths:
+            print(f"no files found in GCS under: gs://{GCS_BUCKET_NAME}/{source_prefix}")
+        else:
+            print(f"successfully downloaded {len(local_paths)} files from gs://{GCS_BUCKET_NAME}/{source_prefix} to {destination_dir}")
+        return sorted(local_paths)
+    except Exception as e:
+        print(f"error occurred during GCS download: {e}")
+        return []
 
-    cursor.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
-    db_schema = cursor.fetchall()
-    bq_schema = [bigquery.SchemaField(col[1], 'STRING') for col in db_schema]
-    column_names = [col[1] for col in db_schema]
-    data_to_load = [dict(zip(column_names, row)) for row in rows]
-    dataset_ref = bq_client.dataset(dataset_id)
-    table_ref = dataset_ref.table(table_name)
-    job_config = bigquery.LoadJobConfig(
-        schema=bq_schema,
-        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
-    )
 
+# one worker per table in main()
+MAX_TABLE_WORKERS = 3
+
+# rows fetched from SQLite and written to the BQ load file per batch
+BQ_EXPORT_BATCH_SIZE = 10000
+
+
+def load_db_to_bigquery(db_path, table_name, dataset_id):
+    """
+    loads data from a SQLite database table into a BigQuery table.
+    rows are streamed in batches into a newline-delimited JSON file next to the db, which is then uploaded as one load job.
+    """
+    print(f"[{table_name}] starting BQ load from '{db_path}'")
+    conn = sqlite3.connect(db_path)
     try:
-        bq_client.create_dataset(dataset_ref, exists_ok=True)
-        load_job = bq_client.load_table_from_json(
-            data_to_load,
-            table_ref,
-            job_config=job_config
-        )
-        print(f" -> starting BQ load job {load_job.job_id} for table '{table_name}'")
-
-        load_job.result()
-        destination_table = bq_client.get_table(table_ref)
-        print(f" -> successfully loaded {destination_table.num_rows} rows into '{table_name}'")
+        cursor = conn.cursor()
+        cursor.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
+        column_names = [col[1] for col in cursor.fetchall()]
+        bq_schema = [bigquery.SchemaField(column, 'STRING') for column in column_names]
+
+        with tempfile.NamedTemporaryFile(suffix='.jsonl', dir=os.path.dirname(db_path) or None) as ndjson_file:
+            row_count = 0
+            cursor.arraysize = BQ_EXPORT_BATCH_SIZE
+            cursor.execute(f"SELECT * FROM {quote_identifier(table_name)}")
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                ndjson_file.write(b"".join(orjson.dumps(dict(zip(column_names, row))) + b"\n" for row in rows))
+                row_count += len(rows)
+            if row_count == 0:
+                print(f"[{table_name}] no data found in SQLite table. skipping BQ load")
+                return
+            ndjson_file.flush()
+
+            dataset_ref = bq_client.dataset(dataset_id)
+            table_ref = dataset_ref.table(table_name)
+            job_config = bigquery.LoadJobConfig(
+                schema=bq_schema,
+                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+            )
 
-    except Exception as e:
-        print(f"an error occurred during the BQ load for table '{table_name}': {e}")
+            try:
+                bq_client.create_dataset(dataset_ref, exists_ok=True)
+                load_job = bq_client.load_table_from_file(
+                    ndjson_file,
+                    table_ref,
+                    rewind=True,
+                    job_config=job_config
+                )
+                print(f"[{table_name}] -> starting BQ load job {load_job.job_id} ({row_count} rows)")
+
+                load_job.result()
+                destination_table = bq_client.get_table(table_ref)
+                print(f"[{table_name}] -> successfully loaded {destination_table.num_rows} rows")
+
+            except Exception as e:
+                print(f"[{table_name}] an error occurred during the BQ load: {e}")
     finally:
         conn.close()
 
 
-def create_connection(db_file):
-    """create a database connection to a sqlite database."""
+# records are grouped and upserted this many at a time so streamed inputs never sit fully in memory
+INGEST_CHUNK_SIZE = 1000
+
+# the per-run staging db in main() is rebuilt from GCS every run and deleted with its temp dir, so it
+# needs no journal file and no fsyncs at all; the in-memory journal still lets a failed ingest roll back
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def create_connection(db_file, pragmas):
+    """
+    create a database connection to a sqlite database and apply the given PRAGMA statements.
+    the connection is in autocommit mode (isolation_level=None): writers open their own transactions explicitly.
+    """
     conn = None
     try:
-        conn = sqlite3.connect(db_file)
+        conn = sqlite3.connect(db_file, isolation_level=None)
+        for pragma in pragmas:
+            conn.execute(pragma)
         print(f"successfully connected to: {db_file}")
     except sqlite3.Error as e:
         print(e)
@@ -89,6 +167,9 @@ def create_connection(db_file):
 
 def create_table(conn, table_name, primary_key):
     """create a table with a primary key if it doesn't exist."""
+    if not (is_valid_identifier(table_name) and is_valid_identifier(primary_key)):
+        print(f"[{table_name}] error creating table: invalid table or primary key name")
+        return
     try:
         c = conn.cursor()
         c.execute(f'''
@@ -96,9 +177,9 @@ def create_table(conn, table_name, primary_key):
                 {quote_identifier(primary_key)} TEXT PRIMARY KEY
             )
         ''')
-        print(f"table '{table_name}' loaded successfully")
+        print(f"[{table_name}] table loaded successfully")
     except sqlite3.Error as e:
-        print(f"error creating table {table_name}: {e}")
+        print(f"[{table_name}] error creating table: {e}")
 
 
 def get_all_records_from_json(json_file):
@@ -107,8 +188,8 @@ def get_all_records_from_json(json_file):
     handles a list of objects, a dictionary of lists, or a single object.
     """
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
         if isinstance(data, list):
             return data
         elif isinstance(data, dict):
@@ -124,107 +205,205 @@ def get_all_records_from_json(json_file):
         else:
             return []
 
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
         print(f"error reading or parsing json file '{json_file}': {e}")
         return []
 
 
-def sync_schema(conn, table_name, all_records, primary_key, static_pk_value=None):
-    """
-    checks for new keys in the records and adds them as new columns
-    to the specified table if they don't already exist.
-    """
-    if not all_records:
-        print(f"no records found to sync schema for table '{table_name}'")
-        return
-
-    c = conn.cursor()
-    json_keys = set()
-    for item in all_records:
-        json_keys.update(item.keys())
-
-    if static_pk_value:
-        json_keys.add(primary_key)
+def iter_records_from_jsonl(jsonl_files):
+    """lazily yields records from one or more JSONL files (one object per line), keeping only one line in memory."""
+    for jsonl_file in jsonl_files:
+        try:
+            with open(jsonl_file, 'rb') as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield orjson.loads(line)
+                    except orjson.JSONDecodeError as e:
+                        print(f"skipping malformed line {line_number} in '{jsonl_file}': {e}")
+        except FileNotFoundError as e:
+            print(f"error reading jsonl file '{jsonl_file}': {e}")
+
+
+def get_table_columns(cursor, table_name):
+    """returns the set of column names currently in the table."""
+    cursor.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
+    return {row[1] for row in cursor.fetchall()}
 
-    c.execute(f"PRAGMA table_info({quote_identifier(table_name)})")
-    db_columns = {row[1] for row in c.fetchall()}
-    new_columns = json_keys - db_columns
-
-    if new_columns:
-        print(f"new fields found for '{table_name}': {', '.join(new_columns)}. syncing schema...")
-        for column in new_columns:
-            try:
-                c.execute(f'ALTER TABLE {quote_identifier(table_name)} ADD COLUMN {quote_identifier(column)} TEXT')
-                print(f" -> added column '{column}' to the '{table_name}' table.")
-            except sqlite3.Error as e:
-                print(f"error adding column {column} to {table_name}: {e}")
-        conn.commit()
-    else:
-        print(f"schema for '{table_name}' is already up-to-date.")
 
+def add_columns(cursor, table_name, columns):
+    """adds each column as TEXT and returns the set of columns that were added."""
+    added = set()
+    for column in columns:
+        if not is_valid_identifier(column):
+            print(f"[{table_name}] error adding column {column!r}: must match {IDENTIFIER_RE.pattern}")
+            continue
+        try:
+            cursor.execute(f'ALTER TABLE {quote_identifier(table_name)} ADD COLUMN {quote_identifier(column)} TEXT')
+            print(f"[{table_name}] -> added column '{column}'")
+            added.add(column)
+        except sqlite3.Error as e:
+            print(f"[{table_name}] error adding column {column}: {e}")
+    return added
 
-def ingest_data(conn, table_name, all_records, primary_key, static_pk_value=None):
-    """read data from a list of records and insert or update them in the specified table."""
-    if not all_records:
-        print(f"no records to ingest for table '{table_name}'")
-        return
 
-    c = conn.cursor()
-    new_count = 0
-    updated_count = 0
+@functools.lru_cache(maxsize=256)
+def build_upsert_sql(table_name, columns, primary_key):
+    """
+    build the upsert statement for one record shape; conflicting rows are only rewritten if a value differs.
+    columns arrive in sorted order, so a shape always maps to the same SQL text and hits sqlite's statement cache.
+    """
+    columns_quoted = ', '.join(quote_identifier(column) for column in columns)
+    placeholders = ', '.join(['?'] * len(columns))
+    update_columns = [quote_identifier(column) for column in columns if column != primary_key]
+    update_clause = ', '.join(f"{column} = excluded.{column}" for column in update_columns)
+    # rows whose values are all unchanged are left alone, so re-ingesting identical records writes nothing
+    changed_clause = ' OR '.join(f"{column} IS NOT excluded.{column}" for column in update_columns)
+    conflict_action = f"DO UPDATE SET {update_clause} WHERE {changed_clause}" if update_columns else "DO NOTHING"
+    return (
+        f"INSERT INTO {quote_identifier(table_name)} ({columns_quoted}) VALUES ({placeholders}) "
+        f"ON CONFLICT({quote_identifier(primary_key)}) {conflict_action}"
+    )
 
-    for record in all_records:
-        if static_pk_value:
-            record[primary_key] = static_pk_value
 
-        sanitized_record = {}
-        for key, value in record.items():
-            if isinstance(value, (dict, list)):
-                sanitized_record[key] = json.dumps(value)
-            else:
-                sanitized_record[key] = value
+# values stored as JSON text rather than as a scalar column value
+JSON_CONTAINER_TYPES = (dict, list)
 
-        pk_value = sanitized_record.get(primary_key)
-        if pk_value is None:
-            print(f"record was skipped bc pk is missing. pk:'{primary_key}', record: {sanitized_record}")
-            continue
 
-        c.execute(f"SELECT {quote_identifier(primary_key)} FROM {quote_identifier(table_name)} WHERE {quote_identifier(primary_key)} = ?", (pk_value,))
-        result = c.fetchone()
+def row_getter(columns):
+    """returns a function that maps a record to a tuple of its values in column order."""
+    if len(columns) == 1:
+        column = columns[0]
+        return lambda record: (record[column],)
+    return operator.itemgetter(*columns)
 
-        columns_quoted = ', '.join(quote_identifier(k) for k in sanitized_record.keys())
-        placeholders = ', '.join(['?'] * len(sanitized_record))
-        values = list(sanitized_record.values())
 
-        if result is None:
-            try:
-                c.execute(f"INSERT INTO {quote_identifier(table_name)} ({columns_quoted}) VALUES ({placeholders})", values)
-                new_count += 1
-            except sqlite3.Error as e:
-                print(f"error inserting record {pk_value} into {table_name}: {e}")
-        else:
-            update_keys = [k for k in sanitized_record.keys() if k != primary_key]
-            if not update_keys:
-                continue
-            update_clause = ', '.join([f"{quote_identifier(key)} = ?" for key in update_keys])
-            update_values = [sanitized_record[k] for k in update_keys] + [pk_value]
-
-            try:
-                c.execute(f"UPDATE {quote_identifier(table_name)} SET {update_clause} WHERE {quote_identifier(primary_key)} = ?", update_values)
-                if c.rowcount > 0:
-                    updated_count += 1
-            except sqlite3.Error as e:
-                print(f"error updating record {pk_value} in {table_name}: {e}")
-
-    conn.commit()
-    print(f"ingestion summary for '{table_name}'")
+def upsert_records(cursor, table_name, records, primary_key, static_pk_value=None, known_columns=None):
+    """
+    upsert a list of records with the given cursor.
+    records are grouped by their set of keys so each group is written with one executemany.
+    if known_columns (the table's cached column set) is given, keys missing from it are added
+    as columns first and the set is updated in place, so no PRAGMA is needed per call.
+    """
+    dumps = orjson.dumps
+    # frozenset(keys) -> (sorted column order, getter for the values in that order, list of value tuples)
+    grouped_rows = {}
+    # settle the pk up front so the grouping loop below has no per-record guard
+    if static_pk_value:
+        for record in records:
+            record[primary_key] = static_pk_value
+    else:
+        valid_records = [record for record in records if record.get(primary_key) is not None]
+        if len(valid_records) < len(records):
+            first_skipped = next(record for record in records if record.get(primary_key) is None)
+            print(f"[{table_name}] {len(records) - len(valid_records)} records were skipped bc pk is missing. pk:'{primary_key}', first record: {first_skipped}")
+            records = valid_records
+
+    for record in records:
+        shape = frozenset(record)
+        group = grouped_rows.get(shape)
+        if group is None:
+            # keys that can't be column names are dropped rather than failing the whole group
+            columns = tuple(sorted(key for key in shape if is_valid_identifier(key)))
+            if len(columns) < len(shape):
+                invalid_keys = sorted(repr(key) for key in shape if not is_valid_identifier(key))
+                print(f"[{table_name}] skipping invalid column names: {', '.join(invalid_keys)} (must match {IDENTIFIER_RE.pattern})")
+            group = grouped_rows[shape] = (columns, row_getter(columns), [])
+        _, get_values, rows = group
+        # exact type checks are enough here: parsed JSON only ever contains plain dicts and lists
+        rows.append(tuple([
+            dumps(value).decode() if type(value) in JSON_CONTAINER_TYPES else value
+            for value in get_values(record)
+        ]))
+
+    if known_columns is not None and grouped_rows:
+        new_columns = frozenset().union(*(columns for columns, _, _ in grouped_rows.values())) - known_columns
+        if new_columns:
+            print(f"[{table_name}] new fields found: {', '.join(new_columns)}. syncing schema...")
+            known_columns |= add_columns(cursor, table_name, new_columns)
+
+    for columns, _, rows in grouped_rows.values():
+        try:
+            cursor.executemany(build_upsert_sql(table_name, columns, primary_key), rows)
+        except sqlite3.Error as e:
+            print(f"[{table_name}] error upserting {len(rows)} records: {e}")
+
+
+def ingest_data(conn, table_name, all_records, primary_key, static_pk_value=None, chunk_size=INGEST_CHUNK_SIZE):
+    """
+    upsert records into the specified table in a single transaction, adding columns for new keys as they appear.
+    all_records may be any iterable (e.g. a streaming reader); it is consumed once, chunk_size records at a time.
+    """
+    c = conn.cursor()
+    count_sql = f"SELECT COUNT(*) FROM {quote_identifier(table_name)}"
+    records = iter(all_records)
+    record_count = 0
+    with conn:
+        # the connection is in autocommit mode, so the transaction is explicit: BEGIN IMMEDIATE takes the write
+        # lock up front, and the column adds and every upsert commit (or roll back) together when the block exits
+        c.execute("BEGIN IMMEDIATE")
+        # read once, then kept current by upsert_records as columns are added
+        known_columns = get_table_columns(c, table_name)
+        rows_before = c.execute(count_sql).fetchone()[0]
+        changes_before = conn.total_changes
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                break
+            record_count += len(chunk)
+            upsert_records(c, table_name, chunk, primary_key, static_pk_value, known_columns)
+        # every insert grows the table and every update doesn't, so the split falls out of two counters
+        new_count = c.execute(count_sql).fetchone()[0] - rows_before
+        updated_count = conn.total_changes - changes_before - new_count
+
+    if record_count == 0:
+        print(f"[{table_name}] no records to ingest")
+        return
+    print(f"[{table_name}] ingestion summary")
     if new_count > 0:
-        print(f"successfully added {new_count} new records")
+        print(f"[{table_name}] successfully added {new_count} new records")
     if updated_count > 0:
-        print(f"successfully updated {updated_count} existing records")
+        print(f"[{table_name}] successfully updated {updated_count} existing records")
     if new_count == 0 and updated_count == 0:
-        print("no new or updated records to process")
-    print("-" * (len(table_name) + 28))
+        print(f"[{table_name}] no new or updated records to process")
+
+
+def process_table(config, temp_dir):
+    """download one table's source from GCS, stage it in its own SQLite db under temp_dir, and load it to BigQuery."""
+    table_name = config["table_name"]
+    primary_key = config["primary_key"]
+    static_pk_value = config.get("static_pk_value")
+    local_db_path = os.path.join(temp_dir, f"{table_name}.db")
+
+    print(f"[{table_name}] processing table")
+    if "gcs_source_prefix" in config:
+        # per-day JSONL shards, e.g. data/raw/tweets/2025-07-29.jsonl
+        local_jsonl_paths = download_prefix_from_gcs(config["gcs_source_prefix"], os.path.join(temp_dir, table_name))
+        if not local_jsonl_paths:
+            return
+    else:
+        gcs_source_file = config["gcs_source_file"]
+        local_json_path = os.path.join(temp_dir, os.path.basename(gcs_source_file))
+        if not download_from_gcs(gcs_source_file, local_json_path):
+            return
+        local_jsonl_paths = [local_json_path] if local_json_path.endswith('.jsonl') else None
+
+    if local_jsonl_paths:
+        # JSONL is streamed in a single pass; ingest_data adds columns as new keys show up
+        records = iter_records_from_jsonl(local_jsonl_paths)
+    else:
+        records = get_all_records_from_json(local_json_path)
+
+    conn = create_connection(local_db_path, pragmas=BULK_LOAD_PRAGMAS)
+    if conn is not None:
+        create_table(conn, table_name, primary_key)
+        ingest_data(conn, table_name, records, primary_key, static_pk_value)
+        conn.close()
+        print(f"[{table_name}] local table '{local_db_path}' created successfully")
+        load_db_to_bigquery(local_db_path, table_name, BIGQUERY_DATASET_ID)
+    else:
+        print(f"[{table_name}] DB connection failed")
 
 
 def main():
@@ -233,12 +412,12 @@ def main():
     tables_to_process = [
         {
             "table_name": "following",
-            "gcs_source_file": f"{gcs_raw_data_path}/following.json",
+            "gcs_source_file": f"{gcs_raw_data_path}/following.jsonl",
             "primary_key": "id"
         },
         {
             "table_name": "tweets",
-            "gcs_source_file": f"{gcs_raw_data_path}/tweets.json",
+            "gcs_source_prefix": f"{gcs_raw_data_path}/tweets/",
             "primary_key": "id"
         },
         {
@@ -249,31 +428,13 @@ def main():
         }
     ]
 
+    # tables are independent (separate db files, GCS objects and BQ tables) and mostly network-bound,
+    # so they are processed concurrently; result() re-raises any worker's exception here
     with tempfile.TemporaryDirectory() as temp_dir:
-        for config in tables_to_process:
-            table_name = config["table_name"]
-            gcs_source_file = config["gcs_source_file"]
-            primary_key = config["primary_key"]
-            static_pk_value = config.get("static_pk_value")
-            local_json_path = os.path.join(temp_dir, os.path.basename(gcs_source_file))
-            local_db_path = os.path.join(temp_dir, f"{table_name}.db")
-
-            print(f"\n processing table '{table_name}'")
-            if not download_from_gcs(gcs_source_file, local_json_path):
-                continue
-
-            conn = create_connection(local_db_path)
-            if conn is not None:
-                create_table(conn, table_name, primary_key)
-                all_records = get_all_records_from_json(local_json_path)
-                if all_records:
-                    sync_schema(conn, table_name, all_records, primary_key, static_pk_value)
-                    ingest_data(conn, table_name, all_records, primary_key, static_pk_value)
-                conn.close()
-                print(f"local table '{local_db_path}' created successfully")
-                load_db_to_bigquery(local_db_path, table_name, BIGQUERY_DATASET_ID)
-            else:
-                print(f"DB connection failed for {table_name}")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_TABLE_WORKERS) as executor:
+            futures = [executor.submit(process_table, config, temp_dir) for config in tables_to_process]
+            for future in futures:
+                future.result()
 
     print("\n DB sync complete")
 